@@ -10,7 +10,9 @@ Features
 
 Install deps on the Pi:
     sudo apt update && sudo apt install -y python3-pip
-    sudo pip3 install pillow python-socketio RPi.GPIO
+    sudo apt install -y pigpio && sudo systemctl enable --now pigpiod
+    sudo pip3 install pillow numpy "python-socketio[asyncio_client]" pigpio
+    sudo pip3 install uvloop  # optional: faster asyncio event loop for the socket
     # Waveshare library (ships as git repo)
     git clone https://github.com/waveshare/epaper.git ~/epaper && \
         sudo python3 ~/epaper/RaspberryPi_JetsonNano/python/install.py
@@ -23,18 +25,34 @@ Systemd:
     follow README / guide to create /etc/systemd/system/picaron.service that runs this file.
 """
 
+import asyncio
+import concurrent.futures
+import ctypes
+import ctypes.util
+import functools
+import mmap
 import os
+import queue
 import sys
 import time
 import threading
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import socketio  # python-socketio client
 
 try:
-    import RPi.GPIO as GPIO  # type: ignore
-except RuntimeError:
-    print("Error: RPi.GPIO must be run as root. Try with sudo.")
+    import uvloop  # type: ignore
+except ImportError:
+    uvloop = None  # optional; falls back to the stdlib asyncio loop
+
+try:
+    import pigpio  # type: ignore
+except ImportError:
+    print(
+        "pigpio library not found.\n"
+        "Install with: sudo apt install -y pigpio python3-pigpio && sudo systemctl enable --now pigpiod"
+    )
     sys.exit(1)
 
 try:
@@ -54,6 +72,10 @@ if not SERVER_URL:
     print("Environment variable SERVER_URL is required, e.g. https://sp-production-b59c.up.railway.app")
     sys.exit(1)
 
+# Reconnect backoff (seconds): starts at RECONNECT_DELAY, doubles up to RECONNECT_DELAY_MAX
+RECONNECT_DELAY = 1
+RECONNECT_DELAY_MAX = 5
+
 # Set to True if an RGB LED is connected and you want Morse blinking.
 ENABLE_LED = False  # <<<<<<<<<<  change to True to re-enable LED support
 
@@ -64,6 +86,8 @@ LED_PINS: Dict[str, int] = {
     "blue": 17,
 }
 PWM_FREQUENCY = 100  # Hz
+# Morse only needs on/off: drive the LED pins as plain digital outputs, no PWM
+MORSE_ONLY = True
 
 # Morse timing (seconds)
 UNIT = 0.25  # base time unit for dot
@@ -76,6 +100,11 @@ GAP_WORD = 7 * UNIT
 # Fonts for e-paper (change path if custom font installed)
 FONT_PATH = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
 FONT_SIZE = 48
+# Counter row: largest font size, and longest count that gets its own (smaller) size to fit
+COUNTER_FONT_SIZE = 32
+COUNTER_MAX_DIGITS = 8
+# Every Nth counter refresh is a full one, to clear the ghosting partial refreshes build up
+FULL_REFRESH_EVERY = 10
 
 # QR code path (must be 118x118 mono PNG placed in raspberry/)
 QR_PATH = os.path.join(os.path.dirname(__file__), "qrcode_118x118.png")
@@ -84,24 +113,67 @@ KEYHOLE_PATH = os.path.join(os.path.dirname(__file__), "24.png")
 
 # ------------------------------------------------------------------------- #
 
-# Morse code map for digits 0-9
-MORSE_DIGITS: Dict[str, str] = {
-    "0": "-----",
-    "1": ".----",
-    "2": "..---",
-    "3": "...--",
-    "4": "....-",
-    "5": ".....",
-    "6": "-....",
-    "7": "--...",
-    "8": "---..",
-    "9": "----.",
-}
+# Morse code for digits 0-9, indexed by digit value and packed 2 bits per
+# element from the low end (01 = dot, 10 = dash, 00 = end of code)
+MORSE_DIGIT_CODES: Tuple[int, ...] = tuple(
+    sum((1 if element == "." else 2) << 2 * i for i, element in enumerate(code))
+    for code in ("-----", ".----", "..---", "...--", "....-",
+                 ".....", "-....", "--...", "---..", "----.")
+)
+
+
+class _Timespec(ctypes.Structure):
+    _fields_ = [("tv_sec", ctypes.c_long), ("tv_nsec", ctypes.c_long)]
+
+
+CLOCK_MONOTONIC = 1  # same clock as time.monotonic_ns() on Linux
+TIMER_ABSTIME = 1
+EINTR = 4
+
+try:
+    _clock_nanosleep = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True).clock_nanosleep
+    _clock_nanosleep.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.POINTER(_Timespec), ctypes.POINTER(_Timespec)]
+except (OSError, AttributeError):
+    _clock_nanosleep = None
+
+
+def sleep_until(deadline_ns: int):
+    """Sleep until an absolute time.monotonic_ns() deadline.
+
+    Uses clock_nanosleep(CLOCK_MONOTONIC, TIMER_ABSTIME) so periodic timing
+    drifts with the clock rather than accumulating scheduler slack from
+    relative sleeps.
+    """
+    if _clock_nanosleep is None:
+        time.sleep(max(0, deadline_ns - time.monotonic_ns()) / 1e9)
+        return
+    ts = _Timespec(deadline_ns // 1_000_000_000, deadline_ns % 1_000_000_000)
+    while _clock_nanosleep(CLOCK_MONOTONIC, TIMER_ABSTIME, ctypes.byref(ts), None) == EINTR:
+        pass  # interrupted by a signal; the absolute deadline is still valid
 
 
 class EPaperDisplay:
     """Handles Waveshare e-Paper drawing."""
 
+    LABEL_TOP = "HAN SIDO"
+    LABEL_BOTTOM = "LEVANTADAS"
+
+    # Fixed attribute set: no per-instance __dict__, attribute reads are slot offsets
+    __slots__ = (
+        "epd", "width", "height", "font",
+        # counter assets and layout
+        "_small_font", "_big_font", "_icon_bits", "_qr_bits",
+        "_l1_w", "_l1_h", "_l3_w", "_l3_h", "_icon_h", "_icon_w", "_icon_gap",
+        "_num_h", "_l1_x", "_l1_y", "_row_y", "_l3_x", "_l3_y",
+        "_band_y0", "_band_y1", "_glyph_sets",
+        # frame composition
+        "_native_pack", "_background", "_background_buf", "_fb", "_fb_lock", "_render_cached",
+        "_tally_canvas",
+        # panel state
+        "_full_mode", "_mode", "_partial", "_last_rendered", "_last_buf",
+        "_partials_left", "_epd_lock",
+    )
+
     def __init__(self):
         self.epd = epd2in13_V2.EPD()
         # Use FULL_UPDATE mode during initialisation (required by newer API)
@@ -112,19 +184,35 @@ class EPaperDisplay:
             self.epd.init()
         self.width, self.height = self.epd.height, self.epd.width  # note orientation swap
         self.font = ImageFont.truetype(FONT_PATH, FONT_SIZE)
-
-    def _draw_tally_group(self, draw, x, y, h, w_gap, s_gap):
-        # draw 4 vertical lines
-        for i in range(4):
-            x_i = x + i * s_gap
-            draw.line((x_i, y, x_i, y + h), fill=0, width=2)
-        # diagonal slash
-        draw.line((x, y, x + 3 * s_gap, y + h), fill=0, width=2)
-        return x + 4 * s_gap + w_gap  # new x cursor
-
-    def _draw_single_stroke(self, draw, x, y, h, s_gap):
-        draw.line((x, y, x, y + h), fill=0, width=2)
-        return x + s_gap
+        self._load_counter_assets()
+        self._measure_layout()
+        self._build_glyph_sets()
+        self._background = self._render_background()  # bool raster, True = white
+        self._native_pack = self._check_pack(self._background)
+        # Labels and QR never change: keep them packed, and re-pack only the counter row
+        self._background_buf = self._frame_buffer(self._background)
+        # Persistent buffer each counter row is composed into
+        self._fb = np.empty_like(self._background[self._band_y0:self._band_y1])
+        self._fb_lock = threading.Lock()  # the pre-render thread composes into it too
+        # Frame buffers keyed by counter value; repeat values skip rendering entirely
+        self._render_cached = functools.lru_cache(maxsize=256)(self._render_counter_and_qr)
+        self._full_mode = getattr(self.epd, "FULL_UPDATE", None)
+        self._mode = self._full_mode
+        self._partial = self._enable_partial_updates()
+        self._last_rendered: Optional[int] = None  # counter currently on the panel
+        self._last_buf: Optional[bytes] = None  # frame currently on the panel
+        self._partials_left = FULL_REFRESH_EVERY - 1  # the base image push was a full refresh
+        # Serialises panel access (mode switches + SPI transfers) across callers
+        self._epd_lock = threading.Lock()
+        # Raster the tally is drawn into, already in device orientation with each
+        # line padded to whole bytes, so it packs with a single np.packbits call
+        self._tally_canvas = np.empty((self.epd.height, (self.epd.width + 7) // 8 * 8), dtype=bool)
+        # Warm the cache with the values the counter spends most of its time on
+        threading.Thread(target=self._prerender, args=(range(100),), daemon=True).start()
+
+    def _prerender(self, numbers):
+        for number in numbers:
+            self._render_cached(number)
 
     def display_tally(self, number: int):
         """Render tally marks representing `number`, rotated 90° for portrait."""
@@ -135,263 +223,634 @@ class EPaperDisplay:
         G_GAP = 10     # additional gap after a full group of 5
         ROW_GAP = 8    # vertical gap between rows
 
-        # Start with an image in landscape (will rotate later)
-        img_land = Image.new("1", (self.height, self.width), 255)  # width/height swapped
-        draw = ImageDraw.Draw(img_land)
-
-        x, y = 0, 0
-        remaining = number
-
-        while remaining > 0 and y + H_STROKE < img_land.height:
-            # Decide group type
-            if remaining >= 5:
-                # Draw 5-stroke tally group
-                # 4 vertical strokes
-                for i in range(4):
-                    x_i = x + i * S_GAP
-                    draw.line((x_i, y, x_i, y + H_STROKE), fill=0, width=2)
-                # diagonal across them
-                draw.line((x, y, x + 3 * S_GAP, y + H_STROKE), fill=0, width=2)
-                x += 4 * S_GAP + G_GAP
-                remaining -= 5
+        canvas_h, canvas_w = self.width, self.height  # landscape: width/height swapped
+
+        # The layout is a regular grid, so stroke positions are computed up front
+        # and drawn with vectorized writes instead of a draw call per stroke.
+        pitch = 4 * S_GAP + G_GAP  # x advance per group of 5
+        per_row = (canvas_w - 4 * S_GAP) // pitch + 1  # groups before wrapping to a new row
+        row_pitch = H_STROKE + ROW_GAP
+        n_rows = max(0, (canvas_h - H_STROKE - 1) // row_pitch + 1)  # rows with y + H_STROKE < canvas_h
+        groups, singles = divmod(max(number, 0), 5)
+
+        g = np.arange(min(groups, n_rows * per_row))
+        group_x = (g % per_row) * pitch
+        group_y = (g // per_row) * row_pitch
+        stroke_x = (group_x[:, None] + S_GAP * np.arange(4)).ravel()  # 4 vertical strokes per group
+        stroke_y = np.repeat(group_y, 4)
+        if singles and groups // per_row < n_rows:
+            # leftover single strokes follow the last group
+            single_x = (groups % per_row) * pitch + S_GAP * np.arange(singles)
+            stroke_x = np.concatenate((stroke_x, single_x))
+            stroke_y = np.concatenate((stroke_y, np.full(singles, (groups // per_row) * row_pitch)))
+
+        # Rotating 90° to make strokes vertical, then mapping that landscape frame
+        # onto the portrait panel (another 90°, as getbuffer() does), nets out to
+        # 180°: mirror the landscape coordinates and draw in device orientation.
+        t = canvas_h - 1 - np.arange(H_STROKE + 1)[:, None]
+        width2 = canvas_w - 1 - np.arange(2)  # strokes are 2 px wide
+        diag = np.floor(np.linspace(0, 3 * S_GAP, H_STROKE + 1) + 0.5).astype(np.intp)
+
+        epd, canvas = self.epd, self._tally_canvas
+        with self._epd_lock:  # also guards the shared canvas
+            canvas.fill(True)  # white, including the line padding columns
+            # Vertical strokes
+            canvas[t - stroke_y[:, None, None], width2 - stroke_x[:, None, None]] = False
+            # Diagonal slash across each group (rounded half up, like PIL's line rasterizer)
+            canvas[t - group_y[:, None, None], width2 - (group_x[:, None] + diag)[:, :, None]] = False
+            if self._native_pack:
+                buf = np.packbits(canvas, axis=1).tobytes()
             else:
-                # Draw single vertical stroke(s)
-                for _ in range(remaining):
-                    draw.line((x, y, x, y + H_STROKE), fill=0, width=2)
-                    x += S_GAP
-                remaining = 0
-
-            # Wrap to new row if hitting right edge
-            if x + 4 * S_GAP > img_land.width:
-                x = 0
-                y += H_STROKE + ROW_GAP
-
-        # Rotate 90° to make strokes vertical relative to display orientation
-        img_rot = img_land.rotate(90, expand=True)
-        self.epd.display(self.epd.getbuffer(img_rot))
+                buf = self._pack(canvas[:, :canvas_w])
+            self._set_mode(self._full_mode)
+            epd.display(buf)
+            self._last_rendered = None
+            self._last_buf = buf
+            self._partials_left = 0  # the counter screen must come back with a full refresh
+
+    def _pack(self, white):
+        """Pack a portrait bool raster (True = white) into the driver's 1-bit frame layout.
+
+        The raster is epd.height x epd.width (panel orientation). Produces
+        the layout epd.getbuffer() does (one panel line per row, MSB first,
+        rows padded to a byte boundary) with a single np.packbits call
+        instead of a per-pixel Python loop, unless _check_pack() found the
+        driver's layout differs, in which case getbuffer() itself is used.
+        Padding bits are never shown; they are set to white here.
+        """
+        if not self._native_pack:
+            # getbuffer() only takes whole frames: pad a band of rows with white and trim
+            rows = white.shape[0]
+            frame = np.ones((self.epd.height, white.shape[1]), dtype=bool)
+            frame[:rows] = white
+            buf = bytes(self.epd.getbuffer(Image.fromarray(frame)))
+            return buf[:len(buf) // self.epd.height * rows]
+        pad = -white.shape[1] % 8
+        if pad:
+            white = np.pad(white, ((0, 0), (0, pad)), constant_values=True)
+        return np.packbits(white, axis=1).tobytes()
+
+    def _check_pack(self, white) -> bool:
+        """Compare _pack() with the driver's getbuffer() once, on a real frame.
+
+        Driver versions differ in bit order and layout; on a mismatch frames
+        go through getbuffer() rather than reach the panel scrambled. The
+        padding bits at the end of each line are ignored: the panel never
+        shows them, and older drivers fill them with 1s where Pillow's
+        tobytes() (used by current ones) leaves 0s.
+        """
+        self._native_pack = True
+        if not hasattr(self.epd, "getbuffer"):
+            return True  # nothing to compare against
+        expected = np.frombuffer(bytes(self.epd.getbuffer(Image.fromarray(white))), dtype=np.uint8)
+        packed = np.frombuffer(self._pack(white), dtype=np.uint8)
+        if expected.size != packed.size:
+            print("[EPD] Packed frame differs from epd.getbuffer(), using the driver's packer")
+            return False
+        visible = np.full(packed.size // white.shape[0], 0xFF, dtype=np.uint8)
+        visible[-1] = (0xFF << (-white.shape[1] % 8)) & 0xFF  # drop the line padding bits
+        if np.any((packed.reshape(white.shape[0], -1) ^ expected.reshape(white.shape[0], -1)) & visible):
+            print("[EPD] Packed frame differs from epd.getbuffer(), using the driver's packer")
+            return False
+        return True
 
     def clear(self):
-        self.epd.Clear(0xFF)
+        with self._epd_lock:
+            self._set_mode(self._full_mode)
+            self.epd.Clear(0xFF)
+            self._last_rendered = None
+            self._last_buf = None
+            self._partials_left = 0
 
     # ------------------ New Counter + QR Layout ------------------ #
     def display_counter_and_qr(self, number: int):
-        """Show numeric counter on top half and QR code on bottom half."""
+        """Show numeric counter on top half and QR code on bottom half.
+
+        Labels and QR never change, so after the background has been pushed
+        once only a partial refresh is needed for the counter row; every
+        FULL_REFRESH_EVERY-th refresh is a full one to clear ghosting.
+        """
+        if number == self._last_rendered:
+            return  # duplicate event, the panel already shows it
+        buf = self._render_cached(number)
+        epd = self.epd
+        with self._epd_lock:
+            if buf != self._last_buf:
+                if self._partial and self._partials_left > 0:
+                    self._set_mode(epd.PART_UPDATE)
+                    epd.displayPartial(buf)
+                    self._partials_left -= 1
+                else:
+                    self._set_mode(self._full_mode)
+                    epd.display(buf)
+                    self._partials_left = FULL_REFRESH_EVERY - 1
+                self._last_buf = buf
+            self._last_rendered = number
+
+    def _measure_layout(self):
+        """Measure the static parts of the counter layout once, centered in the top half."""
+        W = self.epd.width   # 122
+        top_h = self.epd.height // 2
+        draw = ImageDraw.Draw(Image.new("1", (1, 1)))
+
+        self._l1_w, self._l1_h = draw.textsize(self.LABEL_TOP, font=self._small_font)
+        self._l3_w, self._l3_h = draw.textsize(self.LABEL_BOTTOM, font=self._small_font)
+
+        icon = self._icon_bits
+        self._icon_h, self._icon_w = icon.shape if icon is not None else (0, 0)
+        self._icon_gap = 4 if icon is not None else 0
+
+        # Every digit has the same height, so the row positions don't depend on the number
+        _, self._num_h = draw.textsize("0", font=self._big_font)
+        row_h = max(self._num_h, self._icon_h)
+
+        # vertical spacing between lines
+        line_gap = 4
+
+        total_h = self._l1_h + line_gap + row_h + line_gap + self._l3_h
+        self._l1_x = (W - self._l1_w) // 2
+        self._l1_y = (top_h - total_h) // 2  # center vertically within top half
+        self._row_y = self._l1_y + self._l1_h + line_gap
+        self._l3_x = (W - self._l3_w) // 2
+        self._l3_y = self._row_y + row_h + line_gap
+        # Rows the number + icon can touch; everything else is static background
+        self._band_y0 = max(self._row_y, 0)
+        self._band_y1 = min(self._row_y + row_h, self.epd.height)
+
+    def _build_glyph_sets(self):
+        """Pre-rasterize the counter glyphs for every count length up to COUNTER_MAX_DIGITS.
+
+        Each length gets the largest font size (up to COUNTER_FONT_SIZE) at
+        which the number + icon row fits the panel width, so rendering a
+        frame is a dict lookup plus array writes, with no font measuring.
+        """
+        W = self.epd.width
+        draw = ImageDraw.Draw(Image.new("1", (1, 1)))
+        by_size: Dict[int, Tuple[Dict[str, np.ndarray], int]] = {}
+        self._glyph_sets: Dict[int, Tuple[Dict[str, np.ndarray], int]] = {}
+        for n in range(1, COUNTER_MAX_DIGITS + 1):
+            for size in range(COUNTER_FONT_SIZE, 7, -2):
+                font = self._big_font if size == COUNTER_FONT_SIZE else ImageFont.truetype(FONT_PATH, size)
+                num_w, _ = draw.textsize("8" * n, font=font)
+                if num_w + self._icon_gap + self._icon_w <= W:
+                    break
+            if size not in by_size:
+                glyphs = {ch: self._rasterize(ch, font) for ch in "0123456789-"}
+                by_size[size] = (glyphs, glyphs["0"].shape[0])
+            self._glyph_sets[n] = by_size[size]
+
+    def _render_background(self):
+        """Render the static layer (labels + QR) shared by every counter frame."""
         H = self.epd.height  # 250
         W = self.epd.width   # 122
         img = Image.new("1", (W, H), 255)
         draw = ImageDraw.Draw(img)
 
-        # --- Top half: labels + icon + counter ---
-        top_h = H // 2
+        # --- Top half: labels ---
+        draw.text((self._l1_x, self._l1_y), self.LABEL_TOP, font=self._small_font, fill=0)
+        draw.text((self._l3_x, self._l3_y), self.LABEL_BOTTOM, font=self._small_font, fill=0)
+        background = np.array(img)
 
-        # Fonts
-        small_font = ImageFont.truetype(FONT_PATH, 14)
-        big_font = ImageFont.truetype(FONT_PATH, 32)
-
-        # Prepare measurements for all three lines to center vertically
-        l1_text = "HAN SIDO"
-        l3_text = "LEVANTADAS"
+        # --- Bottom half: QR code ---
+        qr = self._qr_bits
+        if qr is not None:
+            top_h = H // 2
+            qr_h, qr_w = qr.shape
+            qr_x = (W - qr_w) // 2
+            qr_y = top_h + (H - top_h - qr_h) // 2
+            self._blit(background, qr, qr_x, qr_y)
+        return background
 
-        l1_w, l1_h = draw.textsize(l1_text, font=small_font)
-        l3_w, l3_h = draw.textsize(l3_text, font=small_font)
+    def _render_counter_and_qr(self, number: int):
+        """Render the counter on the static background into a display buffer (see lru cache in __init__)."""
+        epd, blit, icon = self.epd, self._blit, self._icon_bits
+        row_y, num_h, icon_gap = self._row_y, self._num_h, self._icon_gap
+        y0, y1 = self._band_y0, self._band_y1
 
         num_text = str(number)
-        num_w, num_h = draw.textsize(num_text, font=big_font)
+        glyph_set, glyph_h = self._glyph_sets[min(len(num_text), COUNTER_MAX_DIGITS)]
+        glyphs = [glyph_set[ch] for ch in num_text]
+        num_w = sum(glyph.shape[1] for glyph in glyphs)
+        x = (epd.width - (num_w + icon_gap + self._icon_w)) // 2
+        y = row_y + (num_h - glyph_h) // 2 - y0  # smaller sizes stay centered in the row
+
+        with self._fb_lock:
+            fb = self._fb
+            np.copyto(fb, self._background[y0:y1])
+
+            # Line 2: number, then icon to its right
+            for glyph in glyphs:
+                blit(fb, glyph, x, y, transparent=True)
+                x += glyph.shape[1]
+            if icon is not None:
+                icon_y = row_y + max(0, (num_h - self._icon_h) // 2)
+                blit(fb, icon, x + icon_gap, icon_y - y0)
+            band = self._frame_buffer(fb)
+
+        # The 180° flip keeps the band's rows contiguous, counted from the end of the frame
+        start = (epd.height - y1) * (len(band) // len(fb))
+        bg = self._background_buf
+        return bg[:start] + band + bg[start + len(band):]
 
-        try:
-            icon = Image.open(KEYHOLE_PATH).convert("1")
-        except FileNotFoundError:
-            icon = None
-        icon_w = icon.width if icon else 0
-        icon_h = icon.height if icon else 0
-        gap = 4 if icon else 0
-
-        row_w = num_w + gap + icon_w  # number first, then icon
-        row_h = max(num_h, icon_h)
+    @staticmethod
+    def _blit(fb, tile, x: int, y: int, transparent: bool = False):
+        """Copy a bool tile into fb at (x, y), clipped to fb's bounds.
 
-        # vertical spacing between lines
-        line_gap = 4
+        With transparent=True only the tile's black pixels are drawn, like
+        ImageDraw.text(); otherwise the tile replaces the area, like paste().
+        """
+        h, w = tile.shape
+        x0, y0 = max(x, 0), max(y, 0)
+        x1, y1 = min(x + w, fb.shape[1]), min(y + h, fb.shape[0])
+        if x0 >= x1 or y0 >= y1:
+            return
+        src = tile[y0 - y:y1 - y, x0 - x:x1 - x]
+        if transparent:
+            fb[y0:y1, x0:x1] &= src
+        else:
+            fb[y0:y1, x0:x1] = src
 
-        total_h = l1_h + line_gap + row_h + line_gap + l3_h
-        y_cursor = (top_h - total_h) // 2  # center vertically within top half
-
-        # Line 1
-        l1_x = (W - l1_w) // 2
-        draw.text((l1_x, y_cursor), l1_text, font=small_font, fill=0)
-        y_cursor += l1_h + line_gap
-
-        # Line 2 (number + icon)
-        row_x = (W - row_w) // 2
-        # Draw number
-        draw.text((row_x, y_cursor), num_text, font=big_font, fill=0)
-        # Paste icon to the right of number
-        if icon:
-            icon_x = row_x + num_w + gap
-            icon_y = y_cursor + max(0, (num_h - icon_h) // 2)
-            img.paste(icon, (icon_x, icon_y))
-        y_cursor += row_h + line_gap
-
-        # Line 3
-        l3_x = (W - l3_w) // 2
-        draw.text((l3_x, y_cursor), l3_text, font=small_font, fill=0)
+    @staticmethod
+    def _rasterize(text: str, font):
+        """Render text into a bool tile (True = white) of the size textsize() reports."""
+        w, h = ImageDraw.Draw(Image.new("1", (1, 1))).textsize(text, font=font)
+        img = Image.new("1", (w, h), 255)
+        ImageDraw.Draw(img).text((0, 0), text, font=font, fill=0)
+        return np.asarray(img)
+
+    def _frame_buffer(self, bits):
+        # Rotate 180° so content appears upright when device is mounted inverted;
+        # a reversed view, so packbits reads the pixels backwards without a copy
+        return self._pack(bits[::-1, ::-1])
+
+    def _enable_partial_updates(self) -> bool:
+        """Push the background as the partial-refresh base image and switch to PART_UPDATE."""
+        if not hasattr(self.epd, "displayPartial"):
+            return False  # older drivers only support full refreshes
+        # One-shot full refresh of the static layer
+        self.epd.displayPartBaseImage(self._background_buf)
+        self._set_mode(self.epd.PART_UPDATE)
+        return True
+
+    def _set_mode(self, mode):
+        """Re-initialise the panel only when switching between full and partial refresh."""
+        if mode != self._mode:
+            self.epd.init(mode)
+            self._mode = mode
+
+    def _load_counter_assets(self):
+        """Load fonts, keyhole icon and QR once instead of on every refresh."""
+        self._small_font = ImageFont.truetype(FONT_PATH, 14)
+        self._big_font = ImageFont.truetype(FONT_PATH, COUNTER_FONT_SIZE)
+
+        # Icon and QR are decoded once and kept as bool tiles (True = white)
+        try:
+            with Image.open(KEYHOLE_PATH) as icon:
+                self._icon_bits = np.asarray(icon.convert("1"))
+        except FileNotFoundError:
+            self._icon_bits = None
 
-        # --- Bottom half: QR code ---
         try:
-            qr = Image.open(QR_PATH).convert("1")
+            with Image.open(QR_PATH) as qr_png:
+                qr = qr_png.convert("1")
         except FileNotFoundError:
             print(f"[EPD] QR image not found at {QR_PATH}")
-            qr = None
-        if qr:
-            qr_w, qr_h = qr.size
-            # Resize if larger than available space
-            max_qr_dim = min(W, H - top_h)
-            if qr_w > max_qr_dim or qr_h > max_qr_dim:
-                qr = qr.resize((max_qr_dim, max_qr_dim), Image.NEAREST)
-                qr_w, qr_h = qr.size
-            qr_x = (W - qr_w) // 2
-            qr_y = top_h + (H - top_h - qr_h) // 2
-            img.paste(qr, (qr_x, qr_y))
-
-            # Rotate 180° so content appears upright when device is mounted inverted
-            img_rot = img.rotate(180, expand=True)
-            self.epd.display(self.epd.getbuffer(img_rot))
+            self._qr_bits = None
+            return
+        # Resize if larger than available space (bottom half of the panel)
+        H, W = self.epd.height, self.epd.width
+        max_qr_dim = min(W, H - H // 2)
+        if qr.width > max_qr_dim or qr.height > max_qr_dim:
+            qr = qr.resize((max_qr_dim, max_qr_dim), Image.NEAREST)
+        self._qr_bits = np.asarray(qr)
 
 
 class RGBLed:
-    """Drives a common-cathode/anode RGB LED via PWM to create pulses."""
-
-    def __init__(self, pins: Dict[str, int]):
-        GPIO.setmode(GPIO.BCM)
-        self.pwm_channels: Dict[str, GPIO.PWM] = {}
-        for color, pin in pins.items():
-            GPIO.setup(pin, GPIO.OUT)
-            pwm = GPIO.PWM(pin, PWM_FREQUENCY)
-            pwm.start(0)  # start off
-            self.pwm_channels[color] = pwm
-        self._lock = threading.Lock()
+    """Drives a common-cathode/anode RGB LED via pigpio's DMA-timed PWM.
+
+    The waveform is generated by the pigpiod daemon from DMA, so no Python
+    threads toggle the pins and the pulses stay jitter-free under load.
+    With MORSE_ONLY the pins are plain digital outputs and any non-zero
+    brightness is full on, so no PWM is configured at all.
+    """
+
+    def __init__(self, pins: Dict[str, int], pwm: bool = not MORSE_ONLY):
+        self.pi = pigpio.pi()
+        if not self.pi.connected:
+            print("Error: cannot reach pigpiod. Start it with: sudo systemctl enable --now pigpiod")
+            sys.exit(1)
+        self.pins: Dict[str, int] = dict(pins)
+        self._pwm = pwm
+        for pin in self.pins.values():
+            self.pi.set_mode(pin, pigpio.OUTPUT)
+            if pwm:
+                self.pi.set_PWM_frequency(pin, PWM_FREQUENCY)
+                self.pi.set_PWM_range(pin, 100)  # duty cycle maps 1:1 to 0-100 brightness
+                self.pi.set_PWM_dutycycle(pin, 0)  # start off
+            else:
+                self.pi.write(pin, 0)  # start off
+        # (red, green, blue) pins, so set_color() indexes a tuple instead of hashing color names
+        self._channels = (self.pins["red"], self.pins["green"], self.pins["blue"])
 
     def set_color(self, r: int, g: int, b: int):
-        """Set LED color with 0-100 brightness values."""
-        with self._lock:
-            self.pwm_channels["red"].ChangeDutyCycle(r)
-            self.pwm_channels["green"].ChangeDutyCycle(g)
-            self.pwm_channels["blue"].ChangeDutyCycle(b)
+        """Set LED color with 0-100 brightness values.
+
+        Not locked: MorseBlinker is the only writer while it runs, and the
+        pigpio client already serialises commands on its socket.
+        """
+        ch = self._channels
+        if not self._pwm:
+            write = self.pi.write
+            write(ch[0], 1 if r else 0)
+            write(ch[1], 1 if g else 0)
+            write(ch[2], 1 if b else 0)
+            return
+        set_duty = self.pi.set_PWM_dutycycle
+        set_duty(ch[0], r)
+        set_duty(ch[1], g)
+        set_duty(ch[2], b)
 
     def off(self):
         self.set_color(0, 0, 0)
 
     def cleanup(self):
         self.off()
-        for pwm in self.pwm_channels.values():
-            pwm.stop()
-        GPIO.cleanup()
+        for pin in self.pins.values():
+            self.pi.set_mode(pin, pigpio.INPUT)  # release pins, like GPIO.cleanup()
+        self.pi.stop()
+
+
+class GPIORegisters:
+    """Drives one output pin through the BCM283x GPIO registers mapped from /dev/gpiomem.
+
+    Each edge is a single 32-bit store into GPSET0/GPCLR0 instead of a
+    round trip to pigpiod. Raises OSError where /dev/gpiomem can't be
+    mapped (e.g. the Pi 5, whose GPIO lives on the RP1 chip).
+    """
+
+    GPFSEL0 = 0x00
+    GPSET0 = 0x1C
+    GPCLR0 = 0x28
+
+    def __init__(self, pin: int):
+        with open("/dev/gpiomem", "r+b") as f:
+            self._mem = mmap.mmap(f.fileno(), 4096)
+        self._mask = 1 << pin
+        # Function select: 3 bits per pin, ten pins per GPFSELn register; 0b001 = output
+        fsel = ctypes.c_uint32.from_buffer(self._mem, self.GPFSEL0 + 4 * (pin // 10))
+        shift = (pin % 10) * 3
+        fsel.value = (fsel.value & ~(0b111 << shift)) | (0b001 << shift)
+        del fsel
+        self._set = ctypes.c_uint32.from_buffer(self._mem, self.GPSET0)
+        self._clr = ctypes.c_uint32.from_buffer(self._mem, self.GPCLR0)
+
+    def write(self, level: int):
+        """Drive the pin high for any non-zero level, low otherwise."""
+        if level:
+            self._set.value = self._mask
+        else:
+            self._clr.value = self._mask
+
+    def close(self):
+        self.write(0)
+        # ctypes views export the mmap buffer and must go before it can close
+        del self._set, self._clr
+        self._mem.close()
 
 
 class MorseBlinker(threading.Thread):
     """Background thread that blinks the LED according to the current number."""
 
+    # Event waits wake this early; the rest of each wait is a precise clock_nanosleep
+    WAKE_SLACK_NS = 2_000_000
+
     def __init__(self, led: RGBLed, initial_number: int = 0):
         super().__init__(daemon=True)
         self.led = led
+        try:
+            self._pin: Optional[GPIORegisters] = GPIORegisters(led.pins["blue"])
+            self._set_level = self._pin.write
+        except (OSError, ValueError):
+            print("[LED] /dev/gpiomem unavailable, blinking through pigpio")
+            self._pin = None
+            self._set_level = lambda level: led.set_color(0, 0, level)
         self.number = initial_number
+        self._plan: Optional[Tuple[np.ndarray, np.ndarray]] = (
+            self._compile(initial_number) if initial_number is not None else None
+        )
         self._stop_event = threading.Event()
         self._update_event = threading.Event()
 
     def update_number(self, new_number: int):
         self.number = new_number
+        self._plan = self._compile(new_number)
         self._update_event.set()
 
     def run(self):
         while not self._stop_event.is_set():
-            if self.number is None:
-                time.sleep(1)
+            self._update_event.clear()
+            plan = self._plan
+            deadline = time.monotonic_ns()
+            if plan is None:
+                self._sleep_until(deadline + 1_000_000_000, self._update_event)
                 continue
-            sequence = self._number_to_morse_sequence(self.number)
-            for element in sequence:
-                if self._stop_event.is_set() or self._update_event.is_set():
+            set_level = self._set_level
+            levels, durations = plan
+            for level, duration_ns in zip(levels.tolist(), durations.tolist()):
+                set_level(level)
+                deadline += duration_ns
+                if self._sleep_until(deadline, self._update_event):
+                    deadline = time.monotonic_ns()
                     break  # break inner loop to restart with new number
-                if element == ".":
-                    self._blink(DOT)
-                elif element == "-":
-                    self._blink(DASH)
-                elif element == " ":
-                    time.sleep(GAP_LETTER)
-                elif element == "/":
-                    time.sleep(GAP_WORD)
-            self._update_event.clear()
-            # After finishing a full sequence, pause before repeating
-            time.sleep(GAP_WORD)
+            set_level(0)  # an update may have interrupted a mark
+            # After a full (or interrupted) sequence, pause before repeating; only stop cuts this short
+            self._sleep_until(deadline + round(GAP_WORD * 1e9), self._stop_event)
 
-    def _blink(self, duration: float):
-        self.led.set_color(0, 0, 100)  # blue full brightness
-        time.sleep(duration)
-        self.led.off()
-        time.sleep(GAP_SYMBOL)
+    def _sleep_until(self, deadline_ns: int, event: threading.Event) -> bool:
+        """Sleep until an absolute monotonic deadline, returning True if `event` fires first.
 
-    @staticmethod
-    def _number_to_morse_sequence(number: int) -> List[str]:
-        """Convert number to a flat list of symbols for blinking.
+        The bulk of the wait blocks on the event so updates interrupt it
+        immediately; the last WAKE_SLACK_NS is handed to sleep_until() so
+        the edge still lands on the absolute deadline.
+        """
+        remaining_ns = deadline_ns - time.monotonic_ns() - self.WAKE_SLACK_NS
+        if remaining_ns > 0 and event.wait(remaining_ns / 1e9):
+            return True
+        if event.is_set():
+            return True
+        sleep_until(deadline_ns)
+        return False
 
-        We separate digits with a space character, and terminate the full
-        number with a '/' (word gap) so the pattern repeats cleanly.
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _compile(number: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Compile number into parallel arrays of blue levels and step durations (ns).
+
+        Cached per number, so a value seen before costs a dict lookup; the
+        arrays are shared between calls and therefore read-only.
+        Consecutive pauses are merged, so the plan strictly alternates
+        mark/space and the blink loop is just "set level, sleep" with no
+        dispatch. Digits are separated by a letter gap, and the full number
+        is terminated with a word gap so the pattern repeats cleanly.
         """
-        digits = list(str(number))
-        symbols: List[str] = []
+        digits: List[int] = []
+        rest = abs(number)
+        while True:
+            rest, d = divmod(rest, 10)
+            digits.append(d)
+            if not rest:
+                break
+        digits.reverse()
+        element_ns = (0, round(DOT * 1e9), round(DASH * 1e9))  # indexed by 2-bit element
+        levels: List[int] = []
+        durations: List[int] = []
+
+        def pause(duration: float):
+            duration_ns = round(duration * 1e9)
+            if levels and levels[-1] == 0:
+                durations[-1] += duration_ns
+            else:
+                levels.append(0)
+                durations.append(duration_ns)
+
         for i, d in enumerate(digits):
-            symbols.extend(list(MORSE_DIGITS.get(d, "")))
+            code = MORSE_DIGIT_CODES[d]
+            while code:
+                levels.append(100)  # blue full brightness
+                durations.append(element_ns[code & 3])
+                pause(GAP_SYMBOL)
+                code >>= 2
             if i < len(digits) - 1:
-                symbols.append(" ")  # gap between digits
-        symbols.append("/")  # gap before repeating
-        return symbols
+                pause(GAP_LETTER)  # gap between digits
+        pause(GAP_WORD)  # gap before repeating
+        plan = np.array(levels, dtype=np.uint8), np.array(durations, dtype=np.int64)
+        for array in plan:
+            array.flags.writeable = False
+        return plan
 
     def stop(self):
         self._stop_event.set()
+        self._update_event.set()  # cut short the step in progress
+        self.join()
+        if self._pin:
+            self._pin.close()
+
+
+class DisplayWorker(threading.Thread):
+    """Single consumer that owns counter refreshes of the e-paper.
+
+    Producers hand it the latest count and return immediately. The queue
+    holds one item and a new count replaces an undrawn one, so a burst of
+    events during a refresh (which blocks on SPI for up to ~2 s) collapses
+    into a single redraw of the newest value.
+    """
+
+    def __init__(self, display: EPaperDisplay):
+        super().__init__(daemon=True)
+        self.display = display
+        self._queue: "queue.Queue[Optional[int]]" = queue.Queue(maxsize=1)
+
+    def update_number(self, new_number: int):
+        self._replace(new_number)
+
+    def _replace(self, item: Optional[int]):
+        while True:
+            try:
+                self._queue.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    self._queue.get_nowait()  # drop the stale count
+                except queue.Empty:
+                    pass  # the worker took it first
+
+    def run(self):
+        while True:
+            number = self._queue.get()
+            if number is None:
+                break
+            try:
+                self.display.display_counter_and_qr(number)
+            except Exception as exc:  # keep serving later counts, like a failed handler would
+                print(f"[EPD] Failed to display counter {number}: {exc!r}")
+
+    def stop(self):
+        self._replace(None)  # supersedes any undrawn count
         self.join()
 
 
 # --------------------------- Main application --------------------------- #
 
-def main():
-    display = EPaperDisplay()
+async def main():
+    loop = asyncio.get_running_loop()
+    # Blocking panel work outside DisplayWorker (init, teardown) runs here, off the event loop
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="epd")
+    display = await loop.run_in_executor(executor, EPaperDisplay)
+    display_worker = DisplayWorker(display)
+    display_worker.start()
     led = RGBLed(LED_PINS) if ENABLE_LED else None
     blinker = MorseBlinker(led) if ENABLE_LED else None
     if ENABLE_LED:
         blinker.start()
 
-    sio = socketio.Client()  # defaults to websocket + polling transports
+    sio = socketio.AsyncClient(
+        reconnection=True,
+        reconnection_attempts=0,  # retry forever
+        reconnection_delay=RECONNECT_DELAY,
+        reconnection_delay_max=RECONNECT_DELAY_MAX,
+        randomization_factor=0.3,
+    )
 
     @sio.event
-    def connect():
+    async def connect():
         print("[Socket] Connected to", SERVER_URL)
 
     @sio.event
-    def disconnect():
+    async def disconnect():
         print("[Socket] Disconnected")
 
     @sio.on("globalCounter")
-    def on_global_counter(count):
+    async def on_global_counter(count):
         try:
             count_int = int(count)
         except (ValueError, TypeError):
             print("[Socket] Received invalid counter value:", count)
             return
         print(f"[Socket] Global counter updated: {count_int}")
-        display.display_counter_and_qr(count_int)
+        display_worker.update_number(count_int)
         if ENABLE_LED:
             blinker.update_number(count_int)
 
     try:
-        sio.connect(SERVER_URL, transports=["websocket"])
-        sio.wait()  # block forever, ctrl+c to exit
-    except KeyboardInterrupt:
-        print("Interrupted by user, shutting down…")
+        backoff = RECONNECT_DELAY
+        while True:  # run forever, ctrl+c to exit
+            try:
+                # websocket only: no long-polling handshake or upgrade round trips
+                await sio.connect(SERVER_URL, transports=["websocket"], socketio_path="socket.io")
+            except socketio.exceptions.ConnectionError as exc:
+                print(f"[Socket] Connection failed ({exc}), retrying in {backoff}s")
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, RECONNECT_DELAY_MAX)
+                continue
+            backoff = RECONNECT_DELAY
+            # Drops are retried by the client itself; this only returns once it gives up
+            await sio.wait()
     finally:
+        if sio.connected:
+            await sio.disconnect()
         if ENABLE_LED and blinker:
             blinker.stop()
         if ENABLE_LED and led:
             led.cleanup()
-        display.clear()
+        await loop.run_in_executor(executor, display_worker.stop)
+        await loop.run_in_executor(executor, display.clear)
+        executor.shutdown(wait=False)
 
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        print("Interrupted by user, shutting down…")
@@ -4,26 +4,54 @@ import socket
 import threading
 from queue import Queue
 
+# Pin mode names and the values MockGPIO.modes stores for them
+MODE_MAP = {'IN': 0, 'OUT': 1}
+
 # Mock GPIO implementation for development
 class MockGPIO:
     def __init__(self):
-        self.pins = {}
+        # Pin levels and modes indexed by BCM pin number
+        self.pins = bytearray(32)
+        self.modes = bytearray(32)
         self.stepper_position = 0
     
     def setup(self, pin, mode):
-        self.pins[pin] = mode
+        self.modes[pin] = MODE_MAP[mode]
     
     def output(self, pin, value):
-        self.pins[pin] = value
+        self.pins[pin] = 1 if value else 0
     
     def cleanup(self):
-        self.pins.clear()
+        self.pins[:] = bytes(32)
+        self.modes[:] = bytes(32)
 
 # Configuration
 LIGHT_PIN = 17
 STEPPER_PINS = [18, 23, 24, 25]  # IN1, IN2, IN3, IN4
 STEPS_PER_REVOLUTION = 2048
 STEP_DELAY = 0.001
+IN1, IN2, IN3, IN4 = STEPPER_PINS
+
+# Full-step sequence, one energised coil per step (IN1..IN4)
+STEP_TABLE = ((1, 0, 0, 0), (0, 1, 0, 0), (0, 0, 1, 0), (0, 0, 0, 1))
+
+# STEP_TABLE row indices for a half revolution, built once. Slicing from the
+# current phase gives (phase + k + 1) & 3 going forward; the reverse table is
+# sliced from (-phase) & 3 and gives (phase - k - 1) & 3.
+HALF_REVOLUTION = STEPS_PER_REVOLUTION // 2
+STEP_PATTERN_FORWARD = bytes((i + 1) & 3 for i in range(HALF_REVOLUTION + 3))
+STEP_PATTERN_REVERSE = bytes(-(i + 1) & 3 for i in range(HALF_REVOLUTION + 3))
+
+# time.sleep can overshoot, so a wait sleeps until SPIN_MARGIN seconds before
+# the deadline and only that tail is spun on perf_counter
+SPIN_MARGIN = 0.0005
+
+def _precise_sleep(deadline):
+    remaining = deadline - time.perf_counter()
+    if remaining > SPIN_MARGIN:
+        time.sleep(remaining - SPIN_MARGIN)
+    while time.perf_counter() < deadline:
+        pass
 
 class Controller:
     def __init__(self):
@@ -31,7 +59,6 @@ class Controller:
         self.gpio = MockGPIO()
         self.setup_gpio()
         self.action_queue = Queue()
-        self.running = True
         
         # Start action processing thread
         self.processor = threading.Thread(target=self.process_actions)
@@ -48,12 +75,12 @@ class Controller:
             self.gpio.output(pin, False)
     
     def process_actions(self):
-        while self.running:
-            try:
-                action = self.action_queue.get(timeout=1)
-                self.execute_action(action)
-            except Queue.Empty:
-                continue
+        # Block until work arrives; cleanup() enqueues None to stop the thread
+        while True:
+            action = self.action_queue.get()
+            if action is None:
+                break
+            self.execute_action(action)
     
     def execute_action(self, action):
         action_type = action.get('type')
@@ -64,37 +91,39 @@ class Controller:
             self.activate_stepper()
     
     def toggle_light(self):
-        current_state = self.gpio.pins.get(LIGHT_PIN, False)
+        current_state = self.gpio.pins[LIGHT_PIN]
         self.gpio.output(LIGHT_PIN, not current_state)
         print(f"Light {'turned on' if not current_state else 'turned off'}")
     
     def activate_stepper(self):
         # Rotate 180 degrees
-        steps = STEPS_PER_REVOLUTION // 2
-        direction = 1 if self.gpio.stepper_position < STEPS_PER_REVOLUTION // 2 else -1
+        steps = HALF_REVOLUTION
+        direction = 1 if self.gpio.stepper_position < HALF_REVOLUTION else -1
+        phase = self.gpio.stepper_position & 3
+        if direction == 1:
+            start, pattern = phase, STEP_PATTERN_FORWARD
+        else:
+            start, pattern = -phase & 3, STEP_PATTERN_REVERSE
         
-        for _ in range(steps):
-            self.gpio.stepper_position = (self.gpio.stepper_position + direction) % STEPS_PER_REVOLUTION
-            self._step_sequence()
-            time.sleep(STEP_DELAY)
+        step_sequence = self._step_sequence
+        deadline = time.perf_counter()
+        for index in pattern[start:start + steps]:
+            step_sequence(STEP_TABLE[index])
+            deadline += STEP_DELAY
+            _precise_sleep(deadline)
+        self.gpio.stepper_position = (self.gpio.stepper_position + direction * steps) % STEPS_PER_REVOLUTION
         
         print("Stepper motor completed rotation")
     
-    def _step_sequence(self):
-        # Simple full-step sequence
-        sequence = [
-            [1, 0, 0, 0],
-            [0, 1, 0, 0],
-            [0, 0, 1, 0],
-            [0, 0, 0, 1]
-        ]
-        
-        step = self.gpio.stepper_position % 4
-        for pin, value in zip(STEPPER_PINS, sequence[step]):
-            self.gpio.output(pin, value)
+    def _step_sequence(self, row):
+        output = self.gpio.output
+        output(IN1, row[0])
+        output(IN2, row[1])
+        output(IN3, row[2])
+        output(IN4, row[3])
     
     def cleanup(self):
-        self.running = False
+        self.action_queue.put(None)
         self.processor.join()
         self.gpio.cleanup()
 